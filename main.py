@@ -1,52 +1,125 @@
 # FastAPI: Modern, fast web framework for building APIs with Python
 # Used here to create the video sharing platform's backend server
-from fastapi import FastAPI, Form, UploadFile, Depends, HTTPException, File
+# Request gives access to raw headers (the Range header for video seeking)
+from fastapi import FastAPI, Form, UploadFile, Depends, HTTPException, File, Request
 
 # CORSMiddleware: Handles Cross-Origin Resource Sharing
 # Allows frontend applications from different domains to communicate with this API
 from fastapi.middleware.cors import CORSMiddleware
 
-# FileResponse: Used to send files (videos) as HTTP responses
-# Enables video streaming to clients
-from fastapi.responses import FileResponse
+# run_in_threadpool: Runs blocking CPU-bound work on a worker thread
+# Keeps slow password hashing from stalling the event loop
+from fastapi.concurrency import run_in_threadpool
+
+# StreamingResponse: Sends file content chunk by chunk
+# Enables HTTP 206 partial responses so browsers can seek within videos
+# ORJSONResponse: Serializes JSON with orjson (Rust) instead of json.dumps
+# Response: Raw response, used to send pre-serialized cached JSON bytes
+from fastapi.responses import StreamingResponse, ORJSONResponse, Response
+
+# orjson: Direct access to the fast encoder for the /videos cache, so the
+# cached payload is serialized once and replayed as raw bytes
+import orjson
 
 # SQLAlchemy components for database operations:
-# - create_engine: Creates database connection
 # - Column, Integer, String, ForeignKey, Text, DateTime: Define table column types
-from sqlalchemy import create_engine, Column, Integer, String, ForeignKey, Text, DateTime
+# - event: Hooks into engine lifecycle (used to tune each new SQLite connection)
+# - Index: Declares standalone (composite) indexes on tables
+# - select: Builds SELECT statements for the async execution style
+# - update: Builds UPDATE statements (atomic counter bumps)
+# - delete: Builds DELETE statements (removing a like without fetching it)
+# - lambda_stmt: Caches compiled SQL for hot queries so only bind values change
+# - exists: Builds SELECT EXISTS(...) probes that return a single boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime, event, Index, select, update, delete, lambda_stmt, exists
+
+# IntegrityError: Raised when an INSERT violates a unique constraint
+# Lets the database itself detect duplicates instead of a pre-SELECT
+from sqlalchemy.exc import IntegrityError
 
 # declarative_base: Base class for ORM models
 # Provides the foundation for creating database table classes
 from sqlalchemy.ext.declarative import declarative_base
 
-# sessionmaker: Creates database session factory
+# Async SQLAlchemy components:
+# - create_async_engine: Creates a non-blocking database engine (aiosqlite driver)
+# - async_sessionmaker: Session factory producing AsyncSession objects
+# - async_scoped_session: Hands out one session per asyncio task (i.e. per request)
+# - AsyncSession: Type hint for async database sessions
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, async_scoped_session, AsyncSession
+
 # relationship: Defines relationships between tables
-# Session: Type hint for database sessions
-from sqlalchemy.orm import sessionmaker, relationship, Session
+from sqlalchemy.orm import relationship
+
+# Argon2 password hashing (C implementation, much faster than Werkzeug's
+# pure-Python PBKDF2 at equivalent security):
+# - PasswordHasher: Hashes passwords and verifies them against stored hashes
+# - VerifyMismatchError: Raised when a password doesn't match its hash
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError
 
-# Werkzeug security functions:
-# - generate_password_hash: Encrypts passwords before storing
-# - check_password_hash: Verifies password against stored hash
-from werkzeug.security import generate_password_hash, check_password_hash
+# PyJWT: Signed JSON Web Tokens
+# The token itself carries the user's identity, so authenticated requests
+# verify a local HMAC signature instead of querying the users table
+import jwt
+
+# aiofiles: Async file I/O
+# Lets the upload handler write to disk without blocking the event loop
+import aiofiles
 
 # Standard library imports:
 # - os: File system operations (create directories, remove files)
-# - shutil: High-level file operations (copy uploaded files)
-# - uuid: Generate unique identifiers for uploaded files
+# - uuid: Names in-progress upload temp files
 # - datetime: Handle timestamps for comments
-import os, shutil, uuid, datetime
+# - asyncio: current_task keys the request-scoped database session
+# - hashlib: SHA-256 of uploads for content-addressed filenames
+# - time: monotonic clock for the /videos cache expiry
+import os, uuid, datetime, asyncio, hashlib, time
 
 # Database configuration
 # SQLite database file path - stores all application data
-DATABASE_URL = "sqlite:///database.db"
-
-# Create database engine with SQLite-specific configuration
-# check_same_thread=False allows multiple threads to use the same connection
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-
-# Session factory for creating database sessions
-# bind=engine connects sessions to our database
-SessionLocal = sessionmaker(bind=engine)
+# The aiosqlite driver makes every query awaitable, so the event loop can
+# serve other requests while SQLite works
+DATABASE_URL = "sqlite+aiosqlite:///database.db"
+
+# Create the async database engine
+# Queries run through aiosqlite's worker thread instead of blocking
+# An explicit queue pool keeps up to 10 connections warm (30 under burst),
+# so concurrent readers fan out across connections instead of serializing
+# on a single shared one - WAL mode makes those parallel reads safe
+engine = create_async_engine(DATABASE_URL, pool_size=10, max_overflow=20)
+
+
+# Tune every new SQLite connection for concurrent web traffic
+# Runs once per DBAPI connection, right after it is opened
+# (registered on the underlying sync engine - pool events fire there)
+@event.listens_for(engine.sync_engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    # WAL journal mode: readers no longer block writers (and vice versa)
+    cursor.execute("PRAGMA journal_mode=WAL")
+    # NORMAL sync: fsync at checkpoints instead of on every commit
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    # 8MB page cache (negative value = size in KB)
+    cursor.execute("PRAGMA cache_size=-8000")
+    # Keep temporary tables and indices in memory instead of on disk
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    # Memory-map up to 256MB of the database file for faster reads
+    cursor.execute("PRAGMA mmap_size=268435456")
+    # Wait up to 5 seconds for a lock instead of failing immediately
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+
+# Session factory for creating async database sessions
+# expire_on_commit=False keeps objects usable after commit without a
+# surprise refresh SELECT (which would have to be awaited)
+SessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+# Scope sessions to the current asyncio task
+# Each request runs in its own task, so everything inside one request
+# shares a single session (and its identity map) instead of constructing
+# a fresh Session object per SessionLocal() call
+ScopedSession = async_scoped_session(SessionLocal, scopefunc=asyncio.current_task)
 
 # Base class for all ORM models
 # All database table classes will inherit from this
@@ -55,6 +128,45 @@ Base = declarative_base()
 # Directory path for storing uploaded video files
 UPLOAD_DIR = "./uploads"
 
+# Chunk size for streaming uploads to disk (16MB)
+# Large chunks keep syscall count low for multi-GB video files
+UPLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Chunk size for streaming videos back to clients (1MB)
+# Large enough to keep syscalls cheap, small enough to start playback fast
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Shared Argon2 hasher with library-default parameters
+# Thread-safe, so one instance serves all requests
+password_hasher = PasswordHasher()
+
+# Secret key for signing JWTs
+# Overridable via environment; the default is for local development only
+JWT_SECRET = os.environ.get("JWT_SECRET", "dev-secret-change-me-before-deploying-anywhere")
+
+# Signing algorithm - HMAC-SHA256, verified in microseconds
+JWT_ALGORITHM = "HS256"
+
+# Token lifetime in seconds (24 hours)
+JWT_TTL = 24 * 60 * 60
+
+# Cached /videos response as (expiry, serialized JSON bytes), or None
+# The homepage listing is the hottest read and only changes on
+# upload/delete/like, so serving it from memory skips the database and
+# re-serialization entirely. Safe without a lock: handlers mutate it only
+# from the single event loop thread
+_videos_cache = None
+
+# How long a cached /videos payload stays valid without invalidation
+VIDEOS_CACHE_TTL = 5.0
+
+
+# Drops the cached /videos payload
+# Called by every endpoint that changes what the listing would show
+def invalidate_videos_cache():
+    global _videos_cache
+    _videos_cache = None
+
 # Create uploads directory if it doesn't exist
 # exist_ok=True prevents error if directory already exists
 os.makedirs(UPLOAD_DIR, exist_ok=True)
@@ -70,7 +182,8 @@ class User(Base):
     id = Column(Integer, primary_key=True)
     
     # Username - must be unique across all users
-    username = Column(String, unique=True)
+    # Indexed because it's looked up on every authenticated request
+    username = Column(String, unique=True, index=True)
     
     # Email address of the user
     email = Column(String)
@@ -112,13 +225,17 @@ class Video(Base):
 class Like(Base):
     # Table name in the database
     __tablename__ = 'likes'
-    
+
+    # Composite unique index: makes the (user, video) lookup an index probe
+    # and lets the database itself reject duplicate likes
+    __table_args__ = (Index('ix_like_user_video', 'user_id', 'video_id', unique=True),)
+
     # Primary key - unique identifier for each like
     id = Column(Integer, primary_key=True)
-    
+
     # Foreign key linking to the user who liked
     user_id = Column(Integer, ForeignKey('users.id'))
-    
+
     # Foreign key linking to the video that was liked
     video_id = Column(Integer, ForeignKey('videos.id'))
 
@@ -133,7 +250,8 @@ class Comment(Base):
     id = Column(Integer, primary_key=True)
     
     # Foreign key linking to the video being commented on
-    video_id = Column(Integer, ForeignKey('videos.id'))
+    # Indexed because comments are always fetched per video
+    video_id = Column(Integer, ForeignKey('videos.id'), index=True)
     
     # Foreign key linking to the user who wrote the comment
     user_id = Column(Integer, ForeignKey('users.id'))
@@ -148,13 +266,20 @@ class Comment(Base):
     user = relationship("User")
 
 
-# Create all tables in the database based on the models defined above
-# Only creates tables that don't already exist
-Base.metadata.create_all(bind=engine)
-
 # Initialize FastAPI application instance
 # This is the main application object
-app = FastAPI()
+# orjson serializes the JSON array responses (/videos, /comments) several
+# times faster than the default pure-Python json encoder
+app = FastAPI(default_response_class=ORJSONResponse)
+
+
+# Create all tables in the database based on the models defined above
+# Only creates tables that don't already exist
+# Runs at startup because the async engine can't execute DDL at import time
+@app.on_event("startup")
+async def create_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
 
 # Add CORS middleware to allow cross-origin requests
 # This enables frontend apps on different domains/ports to access the API
@@ -173,29 +298,71 @@ app.add_middleware(
 
 # Dependency function that provides database sessions to route handlers
 # Automatically manages session lifecycle (creation and cleanup)
-def get_db():
-    # Create a new database session
-    db = SessionLocal()
+async def get_db():
     try:
-        # Yield the session to the route handler
-        yield db
+        # Hand out the session scoped to this request's task; repeated
+        # calls within the same request reuse the same session
+        yield ScopedSession()
     finally:
-        # Always close the session when done, even if an error occurs
-        db.close()
+        # Dependency teardown runs in the same task as the handler, so
+        # remove() reliably closes this request's session
+        # (a middleware can't do this: Starlette's BaseHTTPMiddleware runs
+        # the downstream app in a different task than the middleware body)
+        await ScopedSession.remove()
 
 
 # Helper function to authenticate users by their token
-# Returns the User object if token is valid, None otherwise
-def get_user_by_token(token: str, db: Session):
-    # Simple authentication: token is the username
-    # In production, use proper JWT tokens or session IDs
-    return db.query(User).filter(User.username == token).first()
+# Returns the user's id if token is valid, None otherwise
+def get_user_by_token(token: str):
+    # The token is a signed JWT carrying the user's id, so verification is
+    # a local HMAC check - no database round-trip and no cache to maintain
+    try:
+        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+    except jwt.InvalidTokenError:
+        # Bad signature, expired, or malformed token
+        return None
+    # "sub" is stored as a string per the JWT spec; convert back to int
+    return int(payload["sub"])
+
+
+# Precompiled statements for the hottest queries
+# lambda_stmt caches the Python-to-SQL compilation per call site, so each
+# request only swaps bind parameter values instead of rebuilding and
+# re-compiling the whole statement
+
+
+# SELECT a full user row by username (login)
+def user_by_username_stmt(username: str):
+    return lambda_stmt(lambda: select(User).where(User.username == username))
+
+
+# SELECT just the like counter for a video (like toggle response)
+def video_likes_stmt(video_id: int):
+    return lambda_stmt(lambda: select(Video.likes).where(Video.id == video_id))
+
+
+# SELECT EXISTS(...) probe for whether a user liked a video (like status
+# check) - the database short-circuits on the first index hit and sends
+# back a single boolean instead of a row
+def like_exists_stmt(user_id: int, video_id: int):
+    return lambda_stmt(
+        lambda: select(exists().where(Like.user_id == user_id, Like.video_id == video_id))
+    )
+
+
+# SELECT the comment listing for a video, joined with author usernames
+def comments_for_video_stmt(video_id: int):
+    return lambda_stmt(
+        lambda: select(Comment.id, Comment.content, Comment.timestamp, User.username)
+        .join(User, Comment.user_id == User.id)
+        .where(Comment.video_id == video_id)
+    )
 
 
 # Registration endpoint - creates new user accounts
 # POST /register
 @app.post("/register")
-def register(
+async def register(
     # username: Required form field for username
     username: str = Form(...),
     # email: Required form field for email address
@@ -203,26 +370,30 @@ def register(
     # password: Required form field for password (will be hashed)
     password: str = Form(...),
     # db: Database session injected by dependency
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    # Check if username already exists in database
-    if db.query(User).filter(User.username == username).first():
-        # Return 400 error if username is taken
-        raise HTTPException(status_code=400, detail="Username already exists")
-    
-    # Hash the password using Werkzeug's secure hashing
+    # Hash the password using Argon2's secure hashing
     # Never store plain text passwords
-    hashed_pw = generate_password_hash(password)
-    
+    # Hashing is deliberately slow (tens of ms), so run it on a worker
+    # thread; argon2-cffi releases the GIL, so other requests keep moving
+    hashed_pw = await run_in_threadpool(password_hasher.hash, password)
+
     # Create new User object with provided data
     user = User(username=username, email=email, password=hashed_pw)
-    
+
     # Add user to database session
     db.add(user)
-    
+
     # Commit the transaction to save to database
-    db.commit()
-    
+    # The unique index on username doubles as the duplicate check, so this
+    # is one round-trip instead of a SELECT followed by an INSERT
+    try:
+        await db.commit()
+    except IntegrityError:
+        # Unique constraint hit - the username is already taken
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Username already exists")
+
     # Return success message
     return {"message": "User registered successfully"}
 
@@ -230,31 +401,51 @@ def register(
 # Login endpoint - authenticates users and returns access token
 # POST /login
 @app.post("/login")
-def login(
+async def login(
     # username: Required form field
     username: str = Form(...),
     # password: Required form field (plain text, will be verified against hash)
     password: str = Form(...),
     # db: Database session injected by dependency
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     # Query database for user with provided username
-    user = db.query(User).filter(User.username == username).first()
+    user = (await db.execute(user_by_username_stmt(username))).scalar_one_or_none()
     
-    # Check if user exists and password matches the stored hash
-    if not user or not check_password_hash(user.password, password):
-        # Return 400 error if credentials are invalid
+    # Return 400 error if username is unknown
+    if not user:
+        raise HTTPException(status_code=400, detail="Invalid credentials")
+
+    # Verify the password against the stored hash
+    # Argon2 raises on mismatch instead of returning False
+    # Verification costs the same as hashing, so it also runs on a worker
+    # thread instead of blocking the event loop
+    try:
+        await run_in_threadpool(password_hasher.verify, user.password, password)
+    except VerifyMismatchError:
+        # Return 400 error if the password is wrong
         raise HTTPException(status_code=400, detail="Invalid credentials")
     
-    # Return access token (using username as token for simplicity)
-    # In production, generate proper JWT tokens
-    return {"access_token": user.username, "token_type": "bearer"}
+    # Issue a signed JWT carrying the user's id and username
+    # Protected routes decode this locally instead of hitting the database
+    token = jwt.encode(
+        {
+            "sub": str(user.id),  # Subject: the user's id (string per JWT spec)
+            "name": user.username,  # Username, for clients that want to display it
+            "exp": datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=JWT_TTL),  # Expiry
+        },
+        JWT_SECRET,
+        algorithm=JWT_ALGORITHM,
+    )
+
+    # Return the access token
+    return {"access_token": token, "token_type": "bearer"}
 
 
 # Video upload endpoint - allows users to upload videos
 # POST /upload
 @app.post("/upload")
-def upload_video(
+async def upload_video(
     # title: Required video title
     title: str = Form(...),
     # description: Required video description
@@ -264,7 +455,7 @@ def upload_video(
     # file: The video file being uploaded
     file: UploadFile = File(...),
     # db: Database session injected by dependency
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     # Validate that title and description are not empty
     if not title.strip() or not description.strip():
@@ -275,36 +466,61 @@ def upload_video(
         raise HTTPException(status_code=400, detail="No file uploaded")
     
     # Authenticate the user using their token
-    user = get_user_by_token(token, db)
-    if not user:
+    user_id = get_user_by_token(token)
+    if not user_id:
         # Return error if token is invalid
         raise HTTPException(status_code=400, detail="Invalid token")
     
-    # Generate unique filename using UUID to prevent collisions
-    # Format: {random_uuid}_{original_filename}
-    file_path = os.path.join(UPLOAD_DIR, f"{uuid.uuid4().hex}_{file.filename}")
-    
-    # Save the uploaded file to disk
-    with open(file_path, "wb") as f:
-        # Copy file contents from upload to disk
-        shutil.copyfileobj(file.file, f)
+    # Write to a uniquely-named temp file first; the final name is the
+    # SHA-256 of the content, which we only know once the upload finishes
+    tmp_path = os.path.join(UPLOAD_DIR, f"tmp_{uuid.uuid4().hex}")
+
+    # Hash the content as it streams past - SHA-256 is hardware-accelerated
+    # on modern CPUs, so this hides entirely behind the disk writes
+    hasher = hashlib.sha256()
+
+    # Stream the uploaded file to disk in large chunks
+    # Async reads/writes keep the event loop free for other requests,
+    # and 16MB chunks avoid the thousands of tiny syscalls that the old
+    # shutil.copyfileobj (16KB buffer) needed for big videos
+    async with aiofiles.open(tmp_path, "wb") as f:
+        # Read until the upload is exhausted
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            hasher.update(chunk)
+            await f.write(chunk)
+
+    # Content-addressed final name: {sha256}{original extension}
+    # Identical uploads hash to the same name, so duplicates share one file
+    extension = os.path.splitext(file.filename or "")[1]
+    file_path = os.path.join(UPLOAD_DIR, hasher.hexdigest() + extension)
+
+    if os.path.exists(file_path):
+        # This exact content is already on disk - drop the temp copy
+        os.remove(tmp_path)
+    else:
+        # First time we've seen this content - move it into place
+        # os.replace is atomic, so readers never see a half-written file
+        os.replace(tmp_path, file_path)
 
     # Create Video record in database
     video = Video(
         title=title,
         description=description,
         filename=file_path,  # Store file path for later retrieval
-        uploader_id=user.id  # Link video to uploader
+        uploader_id=user_id  # Link video to uploader
     )
     
     # Add video to database session
     db.add(video)
-    
+
     # Commit transaction to save to database
-    db.commit()
-    
+    await db.commit()
+
     # Refresh to get the auto-generated ID
-    db.refresh(video)
+    await db.refresh(video)
+
+    # The listing now has a new entry - drop the cached payload
+    invalidate_videos_cache()
     
     # Return success message with video ID
     return {"message": "Video uploaded successfully", "id": video.id}
@@ -313,104 +529,210 @@ def upload_video(
 # List all videos endpoint - returns video metadata
 # GET /videos
 @app.get("/videos")
-def list_videos(db: Session = Depends(get_db)):
-    # Query all videos from database
-    videos = db.query(Video).all()
-    
-    # Return list of video information as JSON
-    return [
+async def list_videos(db: AsyncSession = Depends(get_db)):
+    global _videos_cache
+
+    # Serve straight from memory while the cached payload is fresh
+    # No database query, no serialization - just sending stored bytes
+    cached = _videos_cache
+    if cached and cached[0] > time.monotonic():
+        return Response(content=cached[1], media_type="application/json")
+
+    # Query just the columns the response needs, joined with the uploader
+    # One SQL statement, and rows come back as plain tuples - no ORM object
+    # construction or identity-map bookkeeping per video
+    rows = (await db.execute(
+        select(Video.id, Video.title, Video.description, Video.likes, User.username)
+        .join(User, Video.uploader_id == User.id)
+    )).all()
+
+    # Build the list of video information
+    payload = [
         {
-            "id": video.id,  # Video unique identifier
-            "title": video.title,  # Video title
-            "description": video.description,  # Video description
-            "likes": video.likes,  # Number of likes
-            "uploader": video.uploader.username  # Username of uploader
+            "id": row.id,  # Video unique identifier
+            "title": row.title,  # Video title
+            "description": row.description,  # Video description
+            "likes": row.likes,  # Number of likes
+            "uploader": row.username  # Username of uploader
         }
         # Iterate through all videos
-        for video in videos
+        for row in rows
     ]
 
-
-# Video streaming endpoint - serves video files
+    # Serialize once and cache the bytes for subsequent requests
+    body = orjson.dumps(payload)
+    _videos_cache = (time.monotonic() + VIDEOS_CACHE_TTL, body)
+
+    # Return the freshly serialized JSON
+    return Response(content=body, media_type="application/json")
+
+
+# Async generator yielding a byte range of a file in 1MB chunks
+# Used by the streaming endpoint to send only what the client asked for
+async def read_file_range(path: str, start: int, end: int):
+    async with aiofiles.open(path, "rb") as f:
+        # Jump to the first requested byte
+        await f.seek(start)
+        # Bytes left to send (range ends are inclusive)
+        remaining = end - start + 1
+        while remaining > 0:
+            # Never read past the end of the requested range
+            chunk = await f.read(min(STREAM_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+# Video streaming endpoint - serves video files with HTTP Range support
+# Browsers send a Range header when the user seeks; answering with 206
+# partial content means scrubbing doesn't re-download the whole file
 # GET /video/{video_id}
 @app.get("/video/{video_id}")
-def stream_video(video_id: int, db: Session = Depends(get_db)):
-    # Query database for video with specified ID
-    video = db.query(Video).filter(Video.id == video_id).first()
-    
+async def stream_video(video_id: int, request: Request, db: AsyncSession = Depends(get_db)):
+    # Fetch the video by primary key
+    # Session.get checks the request's identity map first, so if this
+    # session already loaded the video it's a dict lookup, not a SELECT
+    video = await db.get(Video, video_id)
+
     # Return 404 if video doesn't exist
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
-    
-    # Return the video file as HTTP response
+
+    # Total size of the video file on disk
+    try:
+        file_size = os.path.getsize(video.filename)
+    except OSError:
+        # Database row exists but the file is gone
+        raise HTTPException(status_code=404, detail="Video file not found")
+
+    # Default: serve the whole file
+    start, end = 0, file_size - 1
+    status_code = 200
+
+    # Parse the Range header if the client sent one (format: "bytes=start-end")
+    range_header = request.headers.get("range")
+    if range_header and range_header.startswith("bytes="):
+        range_spec = range_header[len("bytes="):].split("-")
+        if len(range_spec) == 2:
+            try:
+                if not range_spec[0]:
+                    # A suffix range ("bytes=-500") means "the last 500 bytes"
+                    # Players use this to grab the MP4 metadata at the file's end
+                    start = max(file_size - int(range_spec[1]), 0)
+                    end = file_size - 1
+                else:
+                    # An open-ended range ("bytes=500-") means "from 500 to the end"
+                    start = int(range_spec[0])
+                    end = int(range_spec[1]) if range_spec[1] else file_size - 1
+                    # Clamp the end to the actual file size
+                    end = min(end, file_size - 1)
+                # A range past the end of the file is unsatisfiable
+                if start > end:
+                    raise HTTPException(
+                        status_code=416,
+                        detail="Requested range not satisfiable",
+                        headers={"Content-Range": f"bytes */{file_size}"},
+                    )
+                status_code = 206
+            except ValueError:
+                # Unintelligible Range header (e.g. "bytes=abc-def") - per
+                # RFC 9110 ignore it and serve the whole file with a 200
+                start, end = 0, file_size - 1
+
+    # Headers advertising range support and describing the slice served
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Length": str(end - start + 1),
+    }
+    if status_code == 206:
+        headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+
+    # Stream the requested byte range back in 1MB chunks
     # media_type="video/mp4" tells browser it's a video file
-    return FileResponse(video.filename, media_type="video/mp4")
+    return StreamingResponse(
+        read_file_range(video.filename, start, end),
+        status_code=status_code,
+        media_type="video/mp4",
+        headers=headers,
+    )
 
 
 # Like/unlike video endpoint - toggles like status
 # POST /like/{video_id}
 @app.post("/like/{video_id}")
-def like_video(
+async def like_video(
     # video_id: ID of video to like/unlike (from URL path)
     video_id: int,
     # token: Authentication token
     token: str = Form(...),
     # db: Database session
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     # Authenticate user
-    user = get_user_by_token(token, db)
-    if not user:
+    user_id = get_user_by_token(token)
+    if not user_id:
         raise HTTPException(status_code=400, detail="Invalid token")
-    
-    # Find the video in database
-    video = db.query(Video).filter(Video.id == video_id).first()
-    if not video:
-        raise HTTPException(status_code=404, detail="Video not found")
-    
-    # Check if user has already liked this video
-    existing_like = db.query(Like).filter(Like.user_id == user.id, Like.video_id == video_id).first()
-    
-    if existing_like:
-        # User already liked - remove the like (unlike)
-        db.delete(existing_like)
-        # Decrement like count
-        video.likes -= 1
-        liked = False
-    else:
-        # User hasn't liked - add new like
-        like = Like(user_id=user.id, video_id=video_id)
-        db.add(like)
-        # Increment like count
-        video.likes += 1
+
+    # Attempt the like INSERT directly - the unique index on
+    # (user_id, video_id) rejects duplicates, so no pre-SELECT is needed
+    try:
+        db.add(Like(user_id=user_id, video_id=video_id))
+        await db.flush()
         liked = True
-    
+    except IntegrityError:
+        # Unique index hit - user already liked this video, so toggle off
+        await db.rollback()
+        await db.execute(delete(Like).where(Like.user_id == user_id, Like.video_id == video_id))
+        liked = False
+
+    # Bump the counter with a single atomic UPDATE
+    # The database computes likes+/-1 itself - no read-modify-write race,
+    # and no need to hydrate the Video row just to touch one column
+    result = await db.execute(
+        update(Video)
+        .where(Video.id == video_id)
+        .values(likes=Video.likes + (1 if liked else -1))
+    )
+
+    # Zero rows updated means the video doesn't exist
+    if result.rowcount == 0:
+        await db.rollback()
+        raise HTTPException(status_code=404, detail="Video not found")
+
+    # Read back the new count (single indexed column fetch)
+    likes = (await db.execute(video_likes_stmt(video_id))).scalar_one()
+
     # Save changes to database
-    db.commit()
-    
+    await db.commit()
+
+    # The listing shows like counts - drop the cached payload
+    invalidate_videos_cache()
+
     # Return updated like count and current like status
-    return {"likes": video.likes, "liked": liked}
+    return {"likes": likes, "liked": liked}
 
 
 # Check if user liked a video - returns like status
 # POST /liked/{video_id}
 @app.post("/liked/{video_id}")
-def check_liked(
+async def check_liked(
     # video_id: ID of video to check (from URL path)
     video_id: int,
     # token: Authentication token
     token: str = Form(...),
     # db: Database session
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     # Try to authenticate user
-    user = get_user_by_token(token, db)
-    if not user:
+    user_id = get_user_by_token(token)
+    if not user_id:
         # If not authenticated, user hasn't liked the video
         return {"liked": False}
-    
+
     # Check if a Like record exists for this user and video
-    liked = db.query(Like).filter(Like.user_id == user.id, Like.video_id == video_id).first() is not None
+    # EXISTS stops at the first match on the (user_id, video_id) index
+    liked = bool((await db.execute(like_exists_stmt(user_id, video_id))).scalar())
     
     # Return whether user has liked this video
     return {"liked": liked}
@@ -419,27 +741,30 @@ def check_liked(
 # Get all comments for a video
 # GET /comments/{video_id}
 @app.get("/comments/{video_id}")
-def get_comments(video_id: int, db: Session = Depends(get_db)):
-    # Query all comments for the specified video
-    comments = db.query(Comment).filter(Comment.video_id == video_id).all()
+async def get_comments(video_id: int, db: AsyncSession = Depends(get_db)):
+    # Query just the columns the response needs, joined with the author
+    # One SQL statement, plain tuple rows - no Comment/User objects hydrated
+    rows = (await db.execute(comments_for_video_stmt(video_id))).all()
 
     # Return list of comments with user and timestamp info
     return [
         {
-            "id": c.id,  # Comment unique identifier
-            "user": c.user.username,  # Username of commenter
-            "content": c.content,  # Comment text
-            "timestamp": c.timestamp.strftime("%Y-%m-%d %H:%M:%S"),  # Formatted timestamp
+            "id": row.id,  # Comment unique identifier
+            "user": row.username,  # Username of commenter
+            "content": row.content,  # Comment text
+            # UNIX timestamp (UTC) - a single C-level conversion instead of
+            # per-row strftime; the client formats it for display
+            "timestamp": int(row.timestamp.replace(tzinfo=datetime.timezone.utc).timestamp()),
         }
         # Iterate through all comments
-        for c in comments
+        for row in rows
     ]
 
 
 # Add comment to a video
 # POST /comment/{video_id}
 @app.post("/comment/{video_id}")
-def add_comment(
+async def add_comment(
     # video_id: ID of video to comment on (from URL path)
     video_id: int,
     # token: Authentication token
@@ -447,11 +772,11 @@ def add_comment(
     # content: Comment text
     content: str = Form(...),
     # db: Database session
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     # Authenticate user
-    user = get_user_by_token(token, db)
-    if not user:
+    user_id = get_user_by_token(token)
+    if not user_id:
         raise HTTPException(status_code=400, detail="Invalid token")
     
     # Validate that comment is not empty
@@ -461,16 +786,16 @@ def add_comment(
     # Create new Comment object
     comment = Comment(
         video_id=video_id,  # Link to video
-        user_id=user.id,  # Link to user
+        user_id=user_id,  # Link to user
         content=content  # Comment text
     )
     
     # Add comment to database
     db.add(comment)
-    
+
     # Save changes
-    db.commit()
-    
+    await db.commit()
+
     # Return success message
     return {"message": "Comment added successfully"}
 
@@ -478,40 +803,52 @@ def add_comment(
 # Delete video endpoint - removes video and associated data
 # DELETE /video/{video_id}
 @app.delete("/video/{video_id}")
-def delete_video(
+async def delete_video(
     # video_id: ID of video to delete (from URL path)
     video_id: int,
     # token: Authentication token
     token: str = Form(...),
     # db: Database session
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     # Authenticate user
-    user = get_user_by_token(token, db)
-    if not user:
+    user_id = get_user_by_token(token)
+    if not user_id:
         raise HTTPException(status_code=400, detail="Invalid token")
-    
-    # Find the video in database
-    video = db.query(Video).filter(Video.id == video_id).first()
+
+    # Fetch the video by primary key
+    # Session.get checks the request's identity map first, so if this
+    # session already loaded the video it's a dict lookup, not a SELECT
+    video = await db.get(Video, video_id)
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
-    
+
     # Check if user is the uploader (authorization check)
-    if video.uploader_id != user.id:
+    if video.uploader_id != user_id:
         raise HTTPException(status_code=403, detail="Not authorized to delete this video")
-    
-    try:
-        # Try to delete the video file from disk
-        os.remove(video.filename)
-    except FileNotFoundError:
-        # If file doesn't exist, continue anyway (data cleanup)
-        pass
-    
+
+    # Files are content-addressed, so another video may point at the same
+    # file; only remove it from disk when this is the last reference
+    other_ref = (await db.execute(
+        select(Video.id).where(Video.filename == video.filename, Video.id != video_id)
+    )).first()
+
+    if not other_ref:
+        try:
+            # Try to delete the video file from disk
+            os.remove(video.filename)
+        except FileNotFoundError:
+            # If file doesn't exist, continue anyway (data cleanup)
+            pass
+
     # Delete video record from database
-    db.delete(video)
-    
+    await db.delete(video)
+
     # Save changes
-    db.commit()
-    
+    await db.commit()
+
+    # The listing lost an entry - drop the cached payload
+    invalidate_videos_cache()
+
     # Return success message
     return {"message": "Video deleted successfully"}